@@ -9,22 +9,157 @@ larger automation workflows or invoked as a standalone script.
 """
 
 import argparse
+import asyncio
+import calendar
 import datetime
 import os
+import sqlite3
 import sys
-from typing import Generator, Dict, Any, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Generator, Dict, Any, List, Optional
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # Optional C JSON parser; substantially faster than the stdlib on the
+    # large list payloads returned by the content endpoint.
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+
+        _loads = ujson.loads
+    except ImportError:
+        import json
+
+        _loads = json.loads
+
+try:
+    # Optional: vectorizes the staleness comparison over all collected
+    # timestamps in one C pass instead of a per-item Python loop.
+    import numpy as _np
+except ImportError:
+    _np = None
+
+try:
+    # Optional: urllib3 (and httpx) only decode brotli responses when one
+    # of these packages is importable, so only advertise ``br`` when the
+    # client can actually decode what the server would send back.
+    import brotli  # noqa: F401
+except ImportError:
+    try:
+        import brotlicffi as brotli  # noqa: F401
+    except ImportError:
+        brotli = None
+
+_ACCEPT_ENCODING = "br, gzip, deflate" if brotli is not None else "gzip, deflate"
+
+# Prefer the libyaml-backed C loader when PyYAML was built with it; it has
+# the same safety semantics as SafeLoader but parses much faster.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_dt = datetime.datetime
+_utc = datetime.timezone.utc
+# fromisoformat accepts a trailing 'Z' natively from Python 3.11 on
+_ISO_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+def _parse_when(when: str) -> datetime.datetime:
+    """Parse a Confluence ``version.when`` timestamp into a UTC datetime.
+
+    Confluence always emits ``YYYY-MM-DDTHH:MM:SS.sssZ``, so the common
+    case is handled by slicing fixed offsets out of the string, which is
+    considerably cheaper than the general-purpose ISO 8601 parser when
+    called once per page. Anything that doesn't fit the fixed layout
+    falls back to :meth:`datetime.datetime.fromisoformat`.
+
+    The result is always timezone-aware; strings without an offset are
+    interpreted as UTC, so callers never need to normalize.
+    """
+    if when.endswith("Z"):
+        try:
+            return _dt(
+                int(when[0:4]),
+                int(when[5:7]),
+                int(when[8:10]),
+                int(when[11:13]),
+                int(when[14:16]),
+                int(when[17:19]),
+                tzinfo=_utc,
+            )
+        except (ValueError, IndexError):
+            pass
+    if not _ISO_ACCEPTS_Z and when.endswith("Z"):
+        # older Pythons need the suffix spelled as an explicit offset
+        when = when[:-1] + "+00:00"
+    lm = _dt.fromisoformat(when)
+    return lm if lm.tzinfo is not None else lm.replace(tzinfo=_utc)
+
+
+def _when_ts(when: str) -> float:
+    """Epoch-seconds counterpart of :func:`_parse_when`.
+
+    The fast path converts the sliced components straight to a Unix
+    timestamp via :func:`calendar.timegm`, skipping datetime object
+    construction entirely so the staleness check in :func:`analyze`
+    reduces to a plain number comparison.
+    """
+    if when.endswith("Z"):
+        try:
+            return calendar.timegm(
+                (
+                    int(when[0:4]),
+                    int(when[5:7]),
+                    int(when[8:10]),
+                    int(when[11:13]),
+                    int(when[14:16]),
+                    int(when[17:19]),
+                    0,
+                    0,
+                    0,
+                )
+            )
+        except (ValueError, IndexError):
+            pass
+    return _parse_when(when).timestamp()
+
+
+def _last_modified_ts(item: Dict[str, Any]) -> Optional[float]:
+    """Like :func:`get_last_modified` but returning epoch seconds.
+
+    Internal helper for the :func:`analyze` hot loop; returns ``None``
+    when no parseable timestamp is present. Extraction is EAFP: the
+    common case (timestamp present) runs as plain subscripting with no
+    method dispatch.
+    """
+    try:
+        when = item["version"]["when"]
+    except (KeyError, TypeError):
+        return None
+    try:
+        return _when_ts(when)
+    except Exception:
+        return None
 
 
 def load_config(path: Optional[str] = None) -> Dict[str, Any]:
     """Load configuration from a YAML file.
 
     If ``path`` is not provided, the function looks for ``config.yml`` in
-    the same directory as this module. The YAML is loaded with
-    :func:`yaml.safe_load` and an empty dict is returned if the file
-    does not exist or contains no data.
+    the same directory as this module. The YAML is parsed with the safe
+    loader (the C-accelerated variant when available) and an empty dict
+    is returned if the file does not exist or contains no data.
+
+    Parses are cached per (path, mtime), so repeated in-process calls —
+    e.g. a dashboard polling :func:`analyze` — skip re-reading the file
+    until it changes on disk. Treat the returned mapping as read-only.
 
     Parameters
     ----------
@@ -38,31 +173,86 @@ def load_config(path: Optional[str] = None) -> Dict[str, Any]:
     """
     if path is None:
         path = os.path.join(os.path.dirname(__file__), "config.yml")
-    if not os.path.exists(path):
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
         return {}
+    return _load_config_cached(path, mtime)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime: float) -> Dict[str, Any]:
     with open(path, "r", encoding="utf-8") as fh:
-        return yaml.safe_load(fh) or {}
+        return yaml.load(fh, Loader=_YamlLoader) or {}
 
 
-def make_session(config: Dict[str, Any]) -> requests.Session:
-    """Create an authenticated :class:`requests.Session`.
+def make_session(config: Dict[str, Any], http2: bool = False):
+    """Create an authenticated HTTP session.
 
     The function will use the ``username`` and ``api_token`` keys from the
     provided config mapping to set HTTP basic auth on the session. If those
     keys are missing the session will be returned without authentication.
 
+    By default this returns a :class:`requests.Session` mounting an
+    :class:`~requests.adapters.HTTPAdapter` with a keep-alive connection
+    pool and automatic retries, so the many paginated GETs issued
+    against the same host reuse TCP/TLS connections instead of
+    reconnecting per request.
+
+    With ``http2=True`` an :class:`httpx.Client` is returned instead
+    (requires the optional ``httpx[http2]`` dependency): HTTP/2
+    multiplexes the concurrent page fetches from :func:`iterate_pages`
+    over a single connection with HPACK-compressed headers, where
+    HTTP/1.1 needs one connection per in-flight request. Both objects
+    expose the ``get(url, params=..., timeout=...)`` interface the rest
+    of this module relies on. Note that httpx has no equivalent of the
+    status-based retry policy mounted on the default session, so 429 and
+    transient 5xx responses surface immediately instead of being retried
+    with backoff.
+
     Parameters
     ----------
     config:
         Configuration mapping containing authentication values.
+    http2:
+        Return an HTTP/2-capable ``httpx.Client`` instead of a
+        ``requests.Session``.
 
     Returns
     -------
-    requests.Session
+    requests.Session or httpx.Client
         Configured HTTP session object.
     """
+    auth = (config.get("username"), config.get("api_token"))
+    headers = {
+        "Accept": "application/json",
+        "Accept-Encoding": _ACCEPT_ENCODING,
+    }
+
+    if http2:
+        import httpx  # optional dependency, imported lazily
+
+        return httpx.Client(
+            http2=True,
+            auth=auth if auth[0] else None,
+            headers=headers,
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+        )
+
     session = requests.Session()
-    session.auth = (config.get("username"), config.get("api_token"))
+    session.auth = auth
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(headers)
     return session
 
 
@@ -70,13 +260,27 @@ def iterate_pages(
     session: requests.Session,
     base_url: str,
     space_key: Optional[str] = None,
-    limit: int = 50,
-) -> Generator[Dict[str, Any], None, None]:
-    """Yield Confluence page content objects.
+    limit: int = 250,
+    prefetch: int = 8,
+) -> Generator[List[Dict[str, Any]], None, None]:
+    """Yield Confluence page content objects, one API page at a time.
 
     Uses the Confluence REST API endpoint ``/rest/api/content`` and
-    paginates through results. This generator yields raw page objects as
-    returned by the API (dictionaries).
+    paginates through results. This generator yields each page of raw
+    page objects as a list, so consumers iterate the list inline and
+    generator suspend/resume overhead is paid once per API page rather
+    than once per item.
+
+    To hide request latency, upcoming pages are fetched speculatively:
+    because the API pages at fixed ``start`` offsets, up to ``prefetch``
+    GETs for consecutive offsets are kept in flight on a thread pool
+    while the consumer processes the current page. Servers clamp the
+    requested ``limit`` to their own maximum, so the offset stride is
+    the effective page size read back from the first response, and the
+    scan only ends at a short page with no ``_links.next``. Items are
+    yielded in offset order and memory stays bounded to ``prefetch``
+    pages. The session's connection pool (see :func:`make_session`)
+    services the concurrent requests over keep-alive connections.
 
     Parameters
     ----------
@@ -88,42 +292,479 @@ def iterate_pages(
         Optional Confluence space key to filter pages by.
     limit:
         Page size for each API request.
+    prefetch:
+        Maximum number of page requests kept in flight concurrently.
 
     Yields
     ------
-    dict
-        Individual page objects from the Confluence API.
+    list of dict
+        One batch of page objects per API request, in offset order.
     """
     api = base_url.rstrip("/") + "/rest/api/content"
-    start = 0
-    while True:
-        params = {"type": "page", "limit": limit, "start": start, "expand": "version"}
-        if space_key:
-            params["spaceKey"] = space_key
 
-        resp = session.get(api, params=params, timeout=30)
+    # Only the version metadata is expanded and (on Confluence Cloud)
+    # only the fields analyze() reads are requested, keeping payloads
+    # and JSON-decode cost small. Servers that don't know ``fields``
+    # simply ignore it. The immutable portion is built once; only the
+    # start offset varies per request.
+    base_params = {
+        "type": "page",
+        "limit": limit,
+        "expand": "version",
+        "fields": "version.when,id",
+    }
+    if space_key:
+        base_params["spaceKey"] = space_key
+
+    def fetch(start):
+        resp = session.get(api, params={**base_params, "start": start}, timeout=30)
         resp.raise_for_status()
-        data = resp.json()
+        return _loads(resp.content)
+
+    with ThreadPoolExecutor(max_workers=prefetch) as executor:
+        pending = deque([executor.submit(fetch, 0)])
+        # Effective page size: servers clamp the requested limit, so the
+        # stride must come from what the server actually serves per page.
+        eff_limit = None
+        next_start = 0
+        exhausted = False
+        while pending:
+            data = pending.popleft().result()
+
+            # Results are in 'results' for newer API; older variants used
+            # 'page' or 'values'. The direct subscript is the common path.
+            try:
+                results = data["results"]
+            except KeyError:
+                results = data.get("page") or data.get("values") or []
+
+            if eff_limit is None:
+                # Confluence echoes the applied limit in the response;
+                # fall back to the requested one when it doesn't.
+                eff_limit = int(data.get("limit") or 0) or limit
+                next_start = len(results)
+
+            # The result set ends at a short (or empty) page with no next
+            # link; abandon any speculative fetches past it. A short page
+            # that still has a next link means the server clamped the
+            # page size below what we assumed — adopt the real one.
+            if not exhausted and (not results or len(results) < eff_limit):
+                if results and data.get("_links", {}).get("next"):
+                    eff_limit = len(results)
+                else:
+                    exhausted = True
+                    for future in pending:
+                        future.cancel()
+
+            if not exhausted:
+                # keep up to ``prefetch`` consecutive offsets in flight
+                while len(pending) < prefetch:
+                    pending.append(executor.submit(fetch, next_start))
+                    next_start += eff_limit
+
+            if results:
+                yield results
+
+            if exhausted:
+                break
+
 
-        # Results are in 'results' for newer API, fallback to 'page' or 'values'
-        results = data.get("results") or data.get("page") or data.get("values")
-        if results is None:
-            results = data.get("results", [])
+def _build_cql(
+    space_key: Optional[str],
+    cutoff_date: Optional[datetime.date] = None,
+    modified_since: Optional[str] = None,
+) -> str:
+    """Build a CQL expression selecting pages.
+
+    ``cutoff_date`` restricts to pages last modified before that date
+    (stale pages); ``modified_since`` restricts to pages modified at or
+    after the given ``YYYY-MM-DD HH:MM`` timestamp (delta queries).
+
+    The space key is escaped before interpolation so quotes or
+    backslashes in a configured key cannot break out of the CQL string
+    literal.
+    """
+    cql = "type=page"
+    if space_key:
+        escaped = space_key.replace("\\", "\\\\").replace('"', '\\"')
+        cql += ' AND space="{}"'.format(escaped)
+    if cutoff_date is not None:
+        cql += ' AND lastModified < "{}"'.format(cutoff_date.strftime("%Y-%m-%d"))
+    if modified_since is not None:
+        cql += ' AND lastModified >= "{}"'.format(modified_since)
+    return cql
+
+
+def _cql_count(session: requests.Session, base_url: str, cql: str) -> Optional[int]:
+    """Return the server-side match count for a CQL query.
+
+    Issues a single minimal search request and reads the ``totalSize``
+    hint. Returns ``None`` when the server does not report a total, in
+    which case callers should fall back to client-side counting.
+    """
+    api = base_url.rstrip("/") + "/rest/api/content/search"
+    resp = session.get(api, params={"cql": cql, "limit": 1}, timeout=30)
+    resp.raise_for_status()
+    data = _loads(resp.content)
+    total = data.get("totalSize")
+    return int(total) if total is not None else None
 
+
+def _iterate_search(
+    session: requests.Session,
+    base_url: str,
+    cql: str,
+    limit: int = 250,
+) -> Generator[Dict[str, Any], None, None]:
+    """Yield page objects matching a CQL query, with version expanded."""
+    api = base_url.rstrip("/") + "/rest/api/content/search"
+    params = {
+        "cql": cql,
+        "limit": limit,
+        "expand": "version",
+        "fields": "version.when,id",
+    }
+    start = 0
+    eff_limit = None
+    while True:
+        resp = session.get(api, params={**params, "start": start}, timeout=30)
+        resp.raise_for_status()
+        data = _loads(resp.content)
+        results = data.get("results") or []
+        if eff_limit is None:
+            # Servers clamp the requested limit; prefer the effective
+            # page size echoed in the response (see iterate_pages).
+            eff_limit = int(data.get("limit") or 0) or limit
         for item in results:
             yield item
+        # Only a short page with no next link ends the result set; a
+        # short page that links onward just means a clamped page size.
+        if not results or (
+            len(results) < eff_limit and not data.get("_links", {}).get("next")
+        ):
+            break
+        start += len(results)
 
-        size = data.get("size")
-        if size is None:
-            if not results:
-                break
-            start += len(results)
+
+def iterate_stale_pages(
+    session: requests.Session,
+    base_url: str,
+    space_key: Optional[str],
+    cutoff_date: datetime.date,
+    limit: int = 250,
+) -> Generator[Dict[str, Any], None, None]:
+    """Yield only pages last modified before ``cutoff_date``.
+
+    Pushes the staleness filter to the server with a CQL search
+    (``lastModified < cutoff``) so non-stale pages are never transferred
+    or parsed. Pagination is sequential; result sets here are typically
+    a fraction of the full space.
+
+    Parameters
+    ----------
+    session:
+        Authenticated HTTP session.
+    base_url:
+        Confluence base URL.
+    space_key:
+        Optional space key to filter the search.
+    cutoff_date:
+        Pages last modified strictly before this date are yielded.
+    limit:
+        Page size for each API request.
+
+    Yields
+    ------
+    dict
+        Individual page objects matching the staleness filter.
+    """
+    yield from _iterate_search(
+        session, base_url, _build_cql(space_key, cutoff_date), limit=limit
+    )
+
+
+def analyze_cql(
+    session: requests.Session,
+    base_url: str,
+    space_key: Optional[str],
+    threshold_days: int,
+) -> Optional[Dict[str, Any]]:
+    """Compute freshness metrics entirely server-side via CQL counts.
+
+    Instead of downloading and parsing every page, this asks Confluence
+    for two match counts: all pages in scope and pages last modified
+    before the threshold. Returns the same summary mapping as
+    :func:`analyze`, or ``None`` when the server does not report totals
+    (callers should then fall back to the client-side scan).
+
+    Note that pages without any version timestamp are not matched by the
+    ``lastModified`` filter, so the stale count can differ slightly from
+    the client-side scan, which treats such pages as stale.
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cutoff_date = (now - datetime.timedelta(days=threshold_days)).date()
+    total = _cql_count(session, base_url, _build_cql(space_key))
+    stale = _cql_count(session, base_url, _build_cql(space_key, cutoff_date))
+    if total is None or stale is None:
+        return None
+    percent_stale = (stale / total * 100.0) if total else 0.0
+    return {"total": total, "stale": stale, "percent_stale": percent_stale}
+
+
+async def analyze_async(
+    config: Dict[str, Any],
+    base_url: str,
+    space_key: Optional[str],
+    threshold_days: int,
+    limit: int = 250,
+    concurrency: int = 16,
+) -> Dict[str, Any]:
+    """Asynchronous variant of :func:`analyze` built on aiohttp.
+
+    The scan is purely I/O-bound — many small GETs against one host —
+    so an event loop with ``concurrency`` requests in flight on a
+    keep-alive connection pool scales further than the thread-based
+    prefetch in :func:`iterate_pages` without per-request thread
+    switches. Pages are fetched in waves of consecutive offsets and
+    tallied as each response arrives; the wave after a short page is
+    never issued.
+
+    Requires the optional ``aiohttp`` dependency. Takes the config
+    mapping (for credentials) rather than a session, since aiohttp
+    manages its own connection pool. Use ``asyncio.run`` to drive it
+    from synchronous code, as :func:`main` does for ``--async``.
+
+    Parameters are otherwise as for :func:`analyze`, plus
+    ``concurrency`` for the number of in-flight requests.
+    """
+    import aiohttp  # optional dependency, imported lazily
+
+    api = base_url.rstrip("/") + "/rest/api/content"
+    base_params = {
+        "type": "page",
+        "limit": limit,
+        "expand": "version",
+        "fields": "version.when,id",
+    }
+    if space_key:
+        base_params["spaceKey"] = space_key
+
+    cutoff_ts = (
+        datetime.datetime.now(datetime.timezone.utc)
+        - datetime.timedelta(days=threshold_days)
+    ).timestamp()
+    get_ts = _last_modified_ts
+    total = 0
+    stale = 0
+
+    auth = None
+    if config.get("username"):
+        auth = aiohttp.BasicAuth(config["username"], config.get("api_token") or "")
+
+    sem = asyncio.Semaphore(concurrency)
+
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+        auth=auth,
+        headers={"Accept": "application/json"},
+        timeout=aiohttp.ClientTimeout(total=30),
+    ) as session:
+
+        async def fetch(start):
+            async with sem:
+                async with session.get(
+                    api, params={**base_params, "start": start}
+                ) as resp:
+                    resp.raise_for_status()
+                    return _loads(await resp.read())
+
+        def consume(data):
+            nonlocal total, stale
+            results = data.get("results") or []
+            for item in results:
+                total += 1
+                lm_ts = get_ts(item)
+                if lm_ts is None or lm_ts < cutoff_ts:
+                    stale += 1
+            return results
+
+        def ends_scan(data, results, eff_limit):
+            # The result set only ends at a short page with no next link;
+            # servers clamp the requested limit, so short alone is not
+            # enough (see iterate_pages).
+            return not results or (
+                len(results) < eff_limit and not data.get("_links", {}).get("next")
+            )
+
+        # Fetch the first page alone to learn the effective (possibly
+        # clamped) page size before fanning out speculative offsets.
+        data = await fetch(0)
+        results = consume(data)
+        eff_limit = int(data.get("limit") or 0) or limit
+        if results and len(results) < eff_limit and data.get("_links", {}).get("next"):
+            eff_limit = len(results)
+        done = ends_scan(data, results, eff_limit)
+        start = len(results)
+
+        while not done:
+            # One wave of consecutive offsets; offsets past the end of
+            # the result set just come back empty.
+            tasks = [
+                asyncio.ensure_future(fetch(start + i * eff_limit))
+                for i in range(concurrency)
+            ]
+            try:
+                for future in asyncio.as_completed(tasks):
+                    data = await future
+                    if ends_scan(data, consume(data), eff_limit):
+                        done = True
+            finally:
+                # On failure, drop the rest of the wave instead of
+                # leaving unawaited tasks to warn at shutdown.
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            start += concurrency * eff_limit
+
+    percent_stale = (stale / total * 100.0) if total else 0.0
+    return {"total": total, "stale": stale, "percent_stale": percent_stale}
+
+
+def _open_state(path: Optional[str] = None) -> sqlite3.Connection:
+    """Open (creating if needed) the persistent scan-state database.
+
+    Defaults to ``~/.cache/confluence_checker/state.sqlite``. The
+    ``pages`` table records the last known modification timestamp per
+    page, keyed by scan scope (base URL plus space), so repeated runs
+    only need to fetch pages that changed since the previous scan.
+    """
+    if path is None:
+        cache_dir = os.path.join(
+            os.path.expanduser("~"), ".cache", "confluence_checker"
+        )
+        os.makedirs(cache_dir, exist_ok=True)
+        path = os.path.join(cache_dir, "state.sqlite")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS pages ("
+        " scope TEXT NOT NULL,"
+        " id TEXT NOT NULL,"
+        " when_ts REAL,"
+        " PRIMARY KEY (scope, id))"
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+    )
+    return conn
+
+
+def analyze_incremental(
+    session: requests.Session,
+    base_url: str,
+    space_key: Optional[str],
+    threshold_days: int,
+    limit: int = 250,
+    state_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Scan pages incrementally using cached state from previous runs.
+
+    The first run performs a full scan and records every page's
+    last-modified timestamp in a local SQLite cache. Subsequent runs
+    issue a CQL delta query (``lastModified >= last scan``) so only
+    pages that changed since the previous run are transferred and
+    parsed; the summary is then computed from the cache. For periodic
+    runs where nearly all pages are unchanged this collapses the
+    per-run cost to the handful of recently edited pages.
+
+    CQL date literals are interpreted in the server's timezone, not
+    UTC, so the delta query starts a full day before the recorded scan
+    time. The margin re-fetches a few already-cached pages — harmless,
+    since the upsert is idempotent — but guarantees no edit can fall
+    into a timezone-offset gap between runs. Each delta is also
+    cross-checked against the server's match count for the same query;
+    if the counts disagree the run falls back to a full rescan rather
+    than recording an incomplete delta in the cache.
+
+    Pages deleted from Confluence are not removed from the cache, so
+    counts drift slowly on spaces with deletions; remove the state file
+    to force a full rescan.
+
+    Parameters are as for :func:`analyze`, plus ``state_path`` to
+    override the default cache location.
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cutoff_ts = (now - datetime.timedelta(days=threshold_days)).timestamp()
+    scope = "{}|{}".format(base_url.rstrip("/"), space_key or "")
+
+    conn = _open_state(state_path)
+    try:
+        row = conn.execute(
+            "SELECT value FROM meta WHERE key = ?", ("last_scan:" + scope,)
+        ).fetchone()
+        if row is None:
+            # First run: full scan populating the cache.
+            items = (
+                item
+                for batch in iterate_pages(
+                    session, base_url, space_key=space_key, limit=limit
+                )
+                for item in batch
+            )
         else:
-            start += size
+            # Delta run: only pages modified since the previous scan.
+            # The server interprets CQL date literals in its own
+            # timezone, so back the window up by a day to cover any
+            # offset from the UTC scan time we recorded; re-fetched
+            # pages are deduplicated by the idempotent upsert below.
+            since = (
+                datetime.datetime.strptime(row[0], "%Y-%m-%d %H:%M")
+                - datetime.timedelta(days=1)
+            ).strftime("%Y-%m-%d %H:%M")
+            delta_cql = _build_cql(space_key, modified_since=since)
+            delta_items = list(
+                _iterate_search(session, base_url, delta_cql, limit=limit)
+            )
+            # An incomplete delta would advance last_scan past edits the
+            # cache never saw, corrupting every future run. Cross-check
+            # the yielded count against the server's own total for the
+            # same query and distrust the delta on mismatch, falling
+            # back to a full rescan instead.
+            expected = _cql_count(session, base_url, delta_cql)
+            if expected is not None and expected != len(delta_items):
+                items = (
+                    item
+                    for batch in iterate_pages(
+                        session, base_url, space_key=space_key, limit=limit
+                    )
+                    for item in batch
+                )
+            else:
+                items = iter(delta_items)
+        conn.executemany(
+            "INSERT OR REPLACE INTO pages (scope, id, when_ts) VALUES (?, ?, ?)",
+            (
+                (scope, str(item.get("id")), _last_modified_ts(item))
+                for item in items
+            ),
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            ("last_scan:" + scope, now.strftime("%Y-%m-%d %H:%M")),
+        )
+        total = conn.execute(
+            "SELECT COUNT(*) FROM pages WHERE scope = ?", (scope,)
+        ).fetchone()[0]
+        stale = conn.execute(
+            "SELECT COUNT(*) FROM pages"
+            " WHERE scope = ? AND (when_ts IS NULL OR when_ts < ?)",
+            (scope, cutoff_ts),
+        ).fetchone()[0]
+        conn.commit()
+    finally:
+        conn.close()
 
-        links = data.get("_links", {})
-        if not links.get("next") and (not results or len(results) < limit):
-            break
+    percent_stale = (stale / total * 100.0) if total else 0.0
+    return {"total": total, "stale": stale, "percent_stale": percent_stale}
 
 
 def get_last_modified(item: Dict[str, Any]) -> Optional[datetime.datetime]:
@@ -144,14 +785,14 @@ def get_last_modified(item: Dict[str, Any]) -> Optional[datetime.datetime]:
     Optional[datetime.datetime]
         Parsed datetime in UTC or ``None`` when unavailable or unparsable.
     """
-    version = item.get("version") or {}
-    when = version.get("when")
-    if when:
-        try:
-            return datetime.datetime.fromisoformat(when.replace("Z", "+00:00"))
-        except Exception:
-            pass
-    return None
+    try:
+        when = item["version"]["when"]
+    except (KeyError, TypeError):
+        return None
+    try:
+        return _parse_when(when)
+    except Exception:
+        return None
 
 
 def analyze(
@@ -159,7 +800,7 @@ def analyze(
     base_url: str,
     space_key: Optional[str],
     threshold_days: int,
-    limit: int = 50,
+    limit: int = 250,
 ) -> Dict[str, Any]:
     """Scan pages and compute basic freshness metrics.
 
@@ -185,29 +826,74 @@ def analyze(
     dict
         Summary mapping containing ``total``, ``stale`` and ``percent_stale``.
     """
-    total = 0
-    stale = 0
-    now = datetime.datetime.now(datetime.timezone.utc)
-    threshold = datetime.timedelta(days=threshold_days)
-
-    for item in iterate_pages(session, base_url, space_key=space_key, limit=limit):
-        total += 1
-        lm = get_last_modified(item)
-        if lm is None:
-            # If no timestamp, consider it stale
-            stale += 1
-            continue
-        # ensure timezone-aware
-        if lm.tzinfo is None:
-            lm = lm.replace(tzinfo=datetime.timezone.utc)
-        if now - lm > threshold:
-            stale += 1
+    # Reduce the per-item staleness check to a single float comparison:
+    # compute the cutoff as epoch seconds once, outside the loop, and
+    # bind the timestamp accessor to a local so the loop body only does
+    # fast local lookups.
+    cutoff_ts = (
+        datetime.datetime.now(datetime.timezone.utc)
+        - datetime.timedelta(days=threshold_days)
+    ).timestamp()
+    get_ts = _last_modified_ts
+
+    # Collect timestamps first (8 bytes per page once in the array) so
+    # the comparison runs as one vectorized pass when NumPy is present.
+    ts_list = []
+    append_ts = ts_list.append
+    missing = 0  # pages without a timestamp are considered stale
+    for batch in iterate_pages(session, base_url, space_key=space_key, limit=limit):
+        for item in batch:
+            lm_ts = get_ts(item)
+            if lm_ts is None:
+                missing += 1
+            else:
+                append_ts(lm_ts)
+
+    total = len(ts_list) + missing
+    if _np is not None:
+        arr = _np.fromiter(ts_list, dtype=_np.float64, count=len(ts_list))
+        stale = missing + int((arr < cutoff_ts).sum())
+    else:
+        stale = missing + sum(1 for lm_ts in ts_list if lm_ts < cutoff_ts)
 
     percent_stale = (stale / total * 100.0) if total else 0.0
     return {"total": total, "stale": stale, "percent_stale": percent_stale}
 
 
-def main(argv=None):
+def make_scanner(
+    session: requests.Session,
+    base_url: str,
+    space_key: Optional[str] = None,
+    limit: int = 250,
+):
+    """Return a scan callable specialized for one Confluence instance.
+
+    For callers that scan the same instance repeatedly (dashboards,
+    cron), this bakes the session, normalized base URL, space and page
+    size into a closure so each invocation only supplies the staleness
+    threshold and the call path references captured locals.
+
+    Returns
+    -------
+    Callable[[int], dict]
+        ``scan(threshold_days)`` returning the same summary mapping as
+        :func:`analyze`.
+    """
+    base_url = base_url.rstrip("/")
+
+    def scan(threshold_days: int) -> Dict[str, Any]:
+        return analyze(session, base_url, space_key, threshold_days, limit=limit)
+
+    return scan
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    """Translate CLI arguments into a namespace for :func:`main`.
+
+    Kept separate from :func:`main` so embedding scripts call
+    :func:`analyze` (or :func:`make_scanner`) directly with keyword
+    arguments and never pay argparse setup per invocation.
+    """
     parser = argparse.ArgumentParser(description="Confluence freshness checker")
     parser.add_argument("--config", help="Path to YAML config file")
     parser.add_argument("--base-url", required=True, help="Confluence base URL")
@@ -218,20 +904,79 @@ def main(argv=None):
     parser.add_argument(
         "--limit",
         type=int,
-        default=50,
-        help="Page size for API requests (default: 50)",
+        default=250,
+        help="Page size for API requests (default: 250)",
     )
-    args = parser.parse_args(argv)
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="Use an HTTP/2 client so concurrent page fetches multiplex "
+        "over one connection (requires httpx[http2])",
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Scan with asyncio + aiohttp instead of threads "
+        "(requires aiohttp)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Cache page timestamps between runs and only fetch pages "
+        "modified since the last scan",
+    )
+    parser.add_argument(
+        "--cql",
+        action="store_true",
+        help="Count stale pages server-side via CQL instead of scanning "
+        "every page (falls back to a full scan if unsupported)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
 
     cfg = load_config(args.config)
-    session = make_session(cfg)
+    session = make_session(cfg, http2=args.http2)
+
+    # The optional transports raise their own exception hierarchies, so
+    # collect the classes that apply to the selected scan path.
+    http_errors = (requests.HTTPError,)
+    net_errors = (requests.RequestException,)
+    if args.use_async:
+        import aiohttp
+
+        http_errors += (aiohttp.ClientResponseError,)
+        net_errors += (aiohttp.ClientError,)
+    if args.http2:
+        import httpx
+
+        http_errors += (httpx.HTTPStatusError,)
+        net_errors += (httpx.HTTPError,)
 
     try:
-        result = analyze(session, args.base_url, args.space, args.threshold, limit=args.limit)
-    except requests.HTTPError as exc:
+        result = None
+        if args.use_async:
+            result = asyncio.run(
+                analyze_async(
+                    cfg, args.base_url, args.space, args.threshold, limit=args.limit
+                )
+            )
+        elif args.incremental:
+            result = analyze_incremental(
+                session, args.base_url, args.space, args.threshold, limit=args.limit
+            )
+        elif args.cql:
+            result = analyze_cql(session, args.base_url, args.space, args.threshold)
+        if result is None:
+            scan = make_scanner(session, args.base_url, args.space, limit=args.limit)
+            result = scan(args.threshold)
+    except http_errors as exc:
         print("HTTP error:", exc)
         sys.exit(1)
-    except requests.RequestException as exc:
+    except net_errors as exc:
         print("Network error:", exc)
         sys.exit(1)
 
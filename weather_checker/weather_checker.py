@@ -3,15 +3,49 @@ Simple weather checker that fetches current weather data for a specified city us
 """
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# use the C-accelerated safe loader when PyYAML has libyaml support
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# decode JSON with orjson/ujson when installed, stdlib json otherwise
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+        _loads = ujson.loads
+    except ImportError:
+        import json
+        _loads = json.loads
 
 def load_config():
     with open('config.yml', 'r') as file:
-        return yaml.safe_load(file)
+        return yaml.load(file, Loader=_YamlLoader)
+
+def make_session():
+    # pooled keep-alive session with retries, so repeated checks reuse one connection
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers['Accept'] = 'application/json'
+    return session
 
-def check_weather(api_key, city):
+def check_weather(session, api_key, city):
     url = f"http://api.openweathermap.org/data/2.5/weather?q={city}&appid={api_key}&units=metric"
-    response = requests.get(url)
-    return response.json()
+    response = session.get(url)
+    return _loads(response.content)
 
 def print_results(weather_data):
     if weather_data.get('cod') != 200:
@@ -26,5 +60,6 @@ if __name__ == "__main__":
     config = load_config()
     api_key = config['api_key']
     city = config['city']
-    weather_data = check_weather(api_key, city)
+    session = make_session()
+    weather_data = check_weather(session, api_key, city)
     print_results(weather_data)